@@ -299,9 +299,60 @@ class SQLiteStorage:
                 yield tuple(row)
 
 
+class MemoryStorage:
+    """MemoryStorage keeps snapshots and notices in process memory only.
+
+    It offers the same interface as SQLiteStorage, but nothing outlives the
+    framework that holds it, so it's only suitable when state does not need
+    to persist across runs.
+    """
+
+    def __init__(self):
+        self._snapshots = {}
+        self._notices = []
+
+    def close(self):
+        pass
+
+    def commit(self):
+        pass
+
+    def save_snapshot(self, handle_path, snapshot_data):
+        self._snapshots[handle_path] = snapshot_data
+
+    def load_snapshot(self, handle_path):
+        return self._snapshots.get(handle_path)
+
+    def drop_snapshot(self, handle_path):
+        self._snapshots.pop(handle_path, None)
+
+    def save_notice(self, event_path, observer_path, method_name):
+        self._notices.append((event_path, observer_path, method_name))
+
+    def drop_notice(self, event_path, observer_path, method_name):
+        notice = (event_path, observer_path, method_name)
+        self._notices = [n for n in self._notices if n != notice]
+
+    def notices(self, event_path):
+        # Iterate over a copy, as notices may be dropped while being consumed.
+        for notice in list(self._notices):
+            if not event_path or notice[0] == event_path:
+                yield notice
+
+
 class Framework:
+    """Framework dispatches events to their observers and persists state.
+
+    State is stored in the SQLite database at data_path, which may also be
+    ":memory:" for a database that lives only as long as the framework.
 
-    def __init__(self, data_path):
+    If persist is False no database is opened at all, and state is kept in
+    plain process memory instead. The data_path is ignored in that case and
+    may be None. Nothing is saved across runs, so this is only suitable when
+    the state is not needed later, as in tests.
+    """
+
+    def __init__(self, data_path, persist=True):
         self._data_path = data_path
         self._event_count = 0
         self._observers = [] # [(observer, method_name, parent_path, event_key)]
@@ -309,7 +360,12 @@ class Framework:
         self._type_registry = {} # {(parent_path, kind): cls}
         self._type_known = set() # {cls}
 
-        self._storage = SQLiteStorage(data_path)
+        if not persist:
+            self._storage = MemoryStorage()
+        elif data_path is None:
+            raise RuntimeError("Framework requires a data_path unless persist is False")
+        else:
+            self._storage = SQLiteStorage(data_path)
 
     def close(self):
         self._storage.close()
@@ -1,5 +1,6 @@
 #!/usr/bin/python3
 
+import os
 import unittest
 import tempfile
 import shutil
@@ -8,18 +9,53 @@ from pathlib import Path
 
 from juju.framework import Framework, Handle, Event, EventsBase, EventBase, Object
 from juju.framework import NoTypeError, NoSnapshotError, StoredState, StoredDict
+from juju.framework import SQLiteStorage, MemoryStorage
+
+
+_shm_tmpdir = None
+_saved_tempdir = None
+
+
+def setUpModule():
+    # Keep test data in memory-backed storage when the platform offers it.
+    # The tempfile module caches its location, so set it there directly
+    # rather than via TMPDIR.
+    global _shm_tmpdir, _saved_tempdir
+    shm = Path("/dev/shm")
+    if shm.is_dir() and os.access(shm, os.W_OK):
+        _saved_tempdir = tempfile.tempdir
+        _shm_tmpdir = tempfile.mkdtemp(prefix="charmbase-tests-", dir=shm)
+        tempfile.tempdir = _shm_tmpdir
+
+
+def tearDownModule():
+    global _shm_tmpdir, _saved_tempdir
+    if _shm_tmpdir:
+        tempfile.tempdir = _saved_tempdir
+        shutil.rmtree(_shm_tmpdir)
+        _shm_tmpdir = None
+        _saved_tempdir = None
 
 
 class TestFramework(unittest.TestCase):
 
-    def setUp(self):
-        self.tmpdir = Path(tempfile.mkdtemp())
+    @classmethod
+    def setUpClass(cls):
+        cls._root = Path(tempfile.mkdtemp())
 
-    def tearDown(self):
-        shutil.rmtree(self.tmpdir)
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls._root)
 
-    def create_framework(self):
-        return Framework(self.tmpdir / "framework.data")
+    def setUp(self):
+        self.tmpdir = self._root / self.id().rsplit(".", 1)[-1]
+
+    def create_framework(self, persistent=False):
+        # Only tests that reopen the same storage need it to live on disk.
+        if persistent:
+            self.tmpdir.mkdir(exist_ok=True)
+            return Framework(self.tmpdir / "framework.data")
+        return Framework(":memory:")
 
     def test_handle_path(self):
         cases = [
@@ -65,12 +101,12 @@ class TestFramework(unittest.TestCase):
         handle  = Handle(None, "a_foo", "some_key")
         event = Foo(handle, 1)
 
-        framework1 = self.create_framework()
+        framework1 = self.create_framework(persistent=True)
         framework1.register_type(Foo, None, handle.kind)
         framework1.save_snapshot(event)
         framework1.commit()
 
-        framework2 = self.create_framework()
+        framework2 = self.create_framework(persistent=True)
         framework2.register_type(Foo, None, handle.kind)
         event2 = framework2.load_snapshot(handle)
         self.assertEqual(event2.my_n, 2)
@@ -82,7 +118,7 @@ class TestFramework(unittest.TestCase):
         framework2.drop_snapshot(event.handle)
         framework2.commit()
 
-        framework3 = self.create_framework()
+        framework3 = self.create_framework(persistent=True)
         framework3.register_type(Foo, None, handle.kind)
 
         self.assertRaises(NoSnapshotError, framework1.load_snapshot, handle)
@@ -331,7 +367,7 @@ class TestFramework(unittest.TestCase):
         # The event type may have been gone for good, and nobody cares,
         # so this shouldn't be an error scenario.
 
-        framework = self.create_framework()
+        framework = self.create_framework(persistent=True)
 
         class MyEvent(EventBase):
             pass
@@ -360,7 +396,7 @@ class TestFramework(unittest.TestCase):
         framework.commit()
         framework.close()
 
-        framework_copy = self.create_framework()
+        framework_copy = self.create_framework(persistent=True)
 
         # No errors on missing event types here.
         framework_copy.reemit()
@@ -463,20 +499,112 @@ class TestFramework(unittest.TestCase):
         self.assertRaises(AttributeError, lambda: pub.on_a.bar)
         self.assertRaises(AttributeError, lambda: pub.on_b.foo)
 
+    def test_non_persistent_framework(self):
+        framework = Framework(None, persist=False)
+
+        class MyEvent(EventBase):
+            pass
+
+        class MyNotifier(Object):
+            foo = Event(MyEvent)
+
+        class MyObserver(Object):
+            def __init__(self, parent, key):
+                super().__init__(parent, key)
+                self.seen = []
+                self.done = False
+
+            def on_foo(self, event):
+                self.seen.append(event.handle.kind)
+                if not self.done:
+                    event.defer()
+
+        pub = MyNotifier(framework, "1")
+        obs = MyObserver(framework, "1")
+
+        framework.observe(pub.foo, obs)
+        pub.foo.emit()
+        framework.reemit()
+        obs.done = True
+        framework.reemit()
+        framework.reemit()
+
+        self.assertEqual(obs.seen, ["foo", "foo", "foo"])
+        self.assertRaises(NoSnapshotError, framework.load_snapshot, Handle(pub, "foo", "1"))
+
+        try:
+            Framework(None)
+        except RuntimeError as e:
+            self.assertEqual(str(e), "Framework requires a data_path unless persist is False")
+        else:
+            self.fail("RuntimeError not raised")
+
+
+class TestStorage(unittest.TestCase):
+
+    # The same sequence runs against every backend, so they can't drift apart.
+    def check_storage(self, storage):
+        self.assertIsNone(storage.load_snapshot("missing"))
+        storage.save_snapshot("a", b"data")
+        self.assertEqual(storage.load_snapshot("a"), b"data")
+        storage.drop_snapshot("a")
+        self.assertIsNone(storage.load_snapshot("a"))
+
+        storage.save_notice("ev[2]", "obs[1]", "on_b")
+        storage.save_notice("ev[1]", "obs[1]", "on_a")
+        storage.save_notice("ev[2]", "obs[2]", "on_b")
+        storage.save_notice("ev[1]", "obs[1]", "on_a")
+
+        self.assertEqual(list(storage.notices(None)), [
+            ("ev[2]", "obs[1]", "on_b"),
+            ("ev[1]", "obs[1]", "on_a"),
+            ("ev[2]", "obs[2]", "on_b"),
+            ("ev[1]", "obs[1]", "on_a"),
+        ])
+        self.assertEqual(list(storage.notices("ev[2]")), [
+            ("ev[2]", "obs[1]", "on_b"),
+            ("ev[2]", "obs[2]", "on_b"),
+        ])
+
+        # Dropping a notice drops all of its duplicates too.
+        storage.drop_notice("ev[1]", "obs[1]", "on_a")
+        self.assertEqual(list(storage.notices("ev[1]")), [])
+        self.assertEqual(list(storage.notices(None)), [
+            ("ev[2]", "obs[1]", "on_b"),
+            ("ev[2]", "obs[2]", "on_b"),
+        ])
+
+        storage.close()
+
+    def test_sqlite_storage(self):
+        self.check_storage(SQLiteStorage(":memory:"))
+
+    def test_memory_storage(self):
+        self.check_storage(MemoryStorage())
+
 
 class TestStoredState(unittest.TestCase):
 
-    def setUp(self):
-        self.tmpdir = Path(tempfile.mkdtemp())
+    @classmethod
+    def setUpClass(cls):
+        cls._root = Path(tempfile.mkdtemp())
 
-    def tearDown(self):
-        shutil.rmtree(self.tmpdir)
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls._root)
 
-    def create_framework(self):
-        return Framework(self.tmpdir / "framework.data")
+    def setUp(self):
+        self.tmpdir = self._root / self.id().rsplit(".", 1)[-1]
+
+    def create_framework(self, persistent=False):
+        # Only tests that reopen the same storage need it to live on disk.
+        if persistent:
+            self.tmpdir.mkdir(exist_ok=True)
+            return Framework(self.tmpdir / "framework.data")
+        return Framework(":memory:")
 
     def test_basic_state_storage(self):
-        framework = self.create_framework()
+        framework = self.create_framework(persistent=True)
 
         class SomeObject(Object):
             state = StoredState()
@@ -522,7 +650,7 @@ class TestStoredState(unittest.TestCase):
         framework.close()
 
         # Since this has the same absolute object handle, it will get its state back.
-        framework_copy = self.create_framework()
+        framework_copy = self.create_framework(persistent=True)
         obj_copy = SomeObject(framework_copy, "1")
         self.assertEqual(obj_copy.state.foo, 42)
         self.assertEqual(obj_copy.state.bar, "s")